@@ -4,72 +4,327 @@
 Automated compliance checking for the twelve-factor methodology
 """
 
+import io
 import os
 import json
 import re
 import subprocess
 import sys
+import threading
+from itertools import islice
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
-import ast
-import yaml
+from typing import List, Dict, Tuple, Optional, Iterable, Iterator
+
+
+def _compile_union(patterns, flags=0):
+    """Merge (pattern, desc) pairs into a single alternation
+    
+    Pattern i becomes the named group "g<i>", so match.lastgroup maps a
+    hit back to its index in the table.
+    """
+    return re.compile(b"|".join(b"(?P<g%d>%s)" % (i, p.pattern) for i, (p, _) in enumerate(patterns)), flags)
+
+
+def _first_pattern(union, patterns, content: bytes) -> Optional[int]:
+    """Return the index of the highest-priority pattern matching content, or None
+    
+    The union finds the leftmost hit in one pass, but an earlier table entry
+    matching further on still takes priority, so only those are re-checked.
+    """
+    match = union.search(content)
+    if not match:
+        return None
+    hit = int(match.lastgroup[1:])
+    return next((i for i, (p, _) in enumerate(patterns[:hit]) if p.search(content)), hit)
+
+
+# Content patterns, compiled once at import rather than per file. They are
+# bytes patterns so file contents can be scanned without decoding them.
+SUSPICIOUS_PATTERNS = [
+    (re.compile(p, re.IGNORECASE), desc) for p, desc in [
+        (rb'(password|secret|key|token)\s*=\s*["\'][\w\d]{8,}["\']', "Hardcoded secrets"),
+        (rb'(localhost|127\.0\.0\.1):\d+', "Hardcoded localhost URLs"),
+        (rb'https?://[a-zA-Z0-9\.\-]+\.(com|org|net)', "Hardcoded external URLs"),
+        (rb'[A-Z_]+\s*=\s*["\'][^"\']+["\']', "Possible hardcoded config")
+    ]
+]
+
+SESSION_VIOLATIONS = [
+    (re.compile(p, re.IGNORECASE), desc) for p, desc in [
+        (rb'session\[.+\]\s*=', "Session storage detected"),
+        (rb'express-session.*store:\s*new\s*\w+Store', "Server-side session store"),
+        (rb'sticky.?session', "Sticky sessions detected")
+    ]
+]
+
+FS_PATTERNS = [
+    (re.compile(p), desc) for p, desc in [
+        (rb'fs\.write.*(?!\/tmp|\/temp)', "Writing to non-temp filesystem"),
+        (rb'File\.open.*["\']w["\']', "File write operations detected")
+    ]
+]
+
+SERVER_PATTERNS = [
+    (re.compile(p), desc) for p, desc in [
+        (rb'app\.listen\(.*process\.env\.PORT', "Express.js with PORT env var"),
+        (rb'http\.createServer.*\.listen\(.*process\.env\.PORT', "Node.js HTTP server"),
+        (rb'port\s*=\s*os\.environ\.get\(["\']PORT', "Python PORT configuration"),
+        (rb'Rails\.application\.config\.port', "Rails port configuration")
+    ]
+]
+
+SHUTDOWN_PATTERNS = [
+    (re.compile(p), desc) for p, desc in [
+        (rb'process\.on\(["\']SIGTERM', "SIGTERM handler (Node.js)"),
+        (rb'signal\.signal\(signal\.SIGTERM', "SIGTERM handler (Python)"),
+        (rb'trap.*TERM', "SIGTERM trap (Shell)")
+    ]
+]
+
+LOG_FILE_PATTERNS = [
+    (re.compile(p), desc) for p, desc in [
+        (rb'winston.*filename:', "File-based logging (Node.js)"),
+        (rb'log4j.*FileAppender', "File-based logging (Java)")
+    ]
+]
+
+# Plain substrings need no regex; a bytes `in` test is far cheaper
+LOG_FILE_NEEDLES = [
+    (b"FileHandler", "File-based logging (Python)")  # also RotatingFileHandler
+]
+
+STDOUT_NEEDLES = [
+    (b"console.log", "Console logging (Node.js)"),
+    (b"console.error", "Console logging (Node.js)"),
+    (b"print(", "stdout logging (Python)"),
+    (b"logging.StreamHandler", "stdout logging (Python)"),
+    (b"System.out.println", "stdout logging (Java)")
+]
+
+# Substrings every pattern in a case-sensitive table needs; content holding
+# none of a table's anchors cannot match it and skips the regex engine
+FS_ANCHORS = (b"fs.write", b"File.open")
+SERVER_ANCHORS = (b"process.env.PORT", b"os.environ.get", b"Rails.application.config.port")
+SHUTDOWN_ANCHORS = (b"TERM",)
+LOG_FILE_ANCHORS = (b"winston", b"log4j")
+
+SERVICE_ENV_VARS = [
+    b"DATABASE_URL", b"REDIS_URL", b"RABBITMQ_URL",
+    b"ELASTICSEARCH_URL", b"MONGODB_URI", b"CACHE_URL"
+]
+
+# Dependency manifests are parsed as text, so these two are str patterns
+FUZZY_VERSION = re.compile(r'[\^~*]')
+# A requirements.txt line that is not blank, a comment or an option, and has no == pin
+UNPINNED_REQUIREMENT = re.compile(r'^(?!#)[^\S\n]*(?!-)(?!.*==)\S', re.MULTILINE)
+
+# Checks that want a single hit per file scan it once with a union; tables
+# that report every matching pattern keep one search per pattern, since a
+# union's non-overlapping matches can hide a pattern behind another
+SUSPICIOUS_UNION = _compile_union(SUSPICIOUS_PATTERNS, re.IGNORECASE)
+SERVER_UNION = _compile_union(SERVER_PATTERNS)
+
+# Directories that are never part of the app's own source
+SKIP_DIRS = {".git", "node_modules", "__pycache__", ".venv"}
+
+# Build output and vendored code at the project root stay out of the content
+# scan, but are still walked for the artifacts the checks look for
+ARTIFACT_DIRS = {"vendor", "dist", "build"}
+
+# Larger files are minified bundles, data dumps or binaries, not app source
+MAX_FILE_SIZE = 2_000_000
+
+
+def _scandir_recursive(path: str, skip_dirs=SKIP_DIRS):
+    """Yield a DirEntry for every regular file below path, without following symlinks
+    
+    A directory's own files come before anything in its subdirectories, the
+    order Path.rglob uses, so first-N samples favour files near the root.
+    """
+    subdirs = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_symlink():
+                    continue
+                if entry.is_dir():
+                    if entry.name not in skip_dirs:
+                        subdirs.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+    except OSError:
+        pass
+    for subdir in subdirs:
+        yield from _scandir_recursive(subdir)
+
+
+def _suffix(name: str) -> str:
+    """Return the last ".ext" of a file name, or "" if it has none"""
+    _, dot, ext = name.rpartition(".")
+    return "." + ext if dot else ""
+
+
+def _read_bytes(path: str) -> bytes:
+    # One byte past the cap is enough to tell that a file is oversized
+    with open(path, "rb") as f:
+        return f.read(MAX_FILE_SIZE + 1)
+
 
 class TwelveFactorValidator:
     def __init__(self, project_path: str):
         self.project_path = Path(project_path)
-        self.violations = []
-        self.warnings = []
-        self.passes = []
         
-    def validate_all(self) -> Dict:
-        """Run all validation checks"""
+        # Walk the tree once; every check reads from this index
+        root = str(self.project_path)
+        self._files: List[os.DirEntry] = list(_scandir_recursive(root, SKIP_DIRS | ARTIFACT_DIRS))
+        self._file_index: Dict[str, List[os.DirEntry]] = defaultdict(list)
+        for entry in self._files:
+            self._file_index[_suffix(entry.name)].append(entry)
+        
+        # Root-level build output is never read, but its WAR files still count
+        for name in ARTIFACT_DIRS:
+            for entry in _scandir_recursive(os.path.join(root, name)):
+                if _suffix(entry.name) == ".war":
+                    self._file_index[".war"].append(entry)
+        
+        # Every DirEntry.path starts with this, so report paths are a slice
+        self._root_str = os.path.join(root, "")
+        
+        # Most fixed-name checks are against the project root; list it once
+        try:
+            self._root_entries = set(os.listdir(self.project_path))
+        except OSError:
+            self._root_entries = set()
+        
+    def validate_all(self) -> Iterator[Tuple[str, str]]:
+        """Run all validation checks, yielding (severity, message) per finding
+        
+        Severity is one of "pass", "warning" or "violation".
+        """
         print("🔍 Starting 12-Factor Validation...\n")
         
-        self.check_factor_1_codebase()
-        self.check_factor_2_dependencies()
-        self.check_factor_3_config()
-        self.check_factor_4_backing_services()
-        self.check_factor_5_build_release_run()
-        self.check_factor_6_processes()
-        self.check_factor_7_port_binding()
-        self.check_factor_8_concurrency()
-        self.check_factor_9_disposability()
-        self.check_factor_10_dev_prod_parity()
-        self.check_factor_11_logs()
-        self.check_factor_12_admin_processes()
-        
-        return {
-            "violations": self.violations,
-            "warnings": self.warnings,
-            "passes": self.passes,
-            "score": len(self.passes) / (len(self.passes) + len(self.violations)) * 100
-        }
+        self._scan_sources()
+        yield from self.check_factor_1_codebase()
+        yield from self.check_factor_2_dependencies()
+        yield from self.check_factor_3_config()
+        yield from self.check_factor_4_backing_services()
+        yield from self.check_factor_5_build_release_run()
+        yield from self.check_factor_6_processes()
+        yield from self.check_factor_7_port_binding()
+        yield from self.check_factor_8_concurrency()
+        yield from self.check_factor_9_disposability()
+        yield from self.check_factor_10_dev_prod_parity()
+        yield from self.check_factor_11_logs()
+        yield from self.check_factor_12_admin_processes()
+    
+    def _scan_sources(self):
+        """Read every indexed file once and run all content checks against it"""
+        # Some checks only sample the first few files
+        self._config_sample = {f.path for f in islice(self._iter_source_files(), 20)}
+        self._fs_sample = {f.path for f in self._file_index[".js"][:10]}
+        self._stdout_sample = {f.path for f in self._files[:20]}
+        
+        # Set once any file matches the top port-binding pattern; nothing
+        # later can outrank it, so the remaining files skip that scan
+        self._port_top_hit = threading.Event()
+        
+        # Files are independent, so read and scan them concurrently. Hits are
+        # merged here in walk order, which keeps the report the same from
+        # run to run
+        self._findings: Dict[str, List[Tuple[os.DirEntry, str]]] = defaultdict(list)
+        with ThreadPoolExecutor() as executor:
+            scans = [(file, executor.submit(self._scan_one_file, file, _suffix(file.name)))
+                     for file in self._files]
+            for file, scan in scans:
+                for check, desc in scan.result():
+                    self._findings[check].append((file, desc))
+    
+    def _iter_source_files(self):
+        """Yield indexed source files lazily, in the order factor III samples them"""
+        for ext in (".py", ".js", ".java", ".rb"):
+            yield from self._file_index[ext]
+    
+    def _scan_one_file(self, file: os.DirEntry, suffix: str) -> List[Tuple[str, str]]:
+        """Read one file and return (check, desc) for every content check it matches"""
+        try:
+            content = _read_bytes(file.path)
+        except OSError:
+            return []
+        if len(content) > MAX_FILE_SIZE:
+            return []
+        
+        hits = []
+        
+        # Factor III: hardcoded secrets/configs
+        if file.path in self._config_sample:
+            hit = _first_pattern(SUSPICIOUS_UNION, SUSPICIOUS_PATTERNS, content)
+            if hit is not None:
+                hits.append(("config", SUSPICIOUS_PATTERNS[hit][1]))
+        
+        # Factor IV: backing services from environment variables
+        if suffix == ".py" and b"os.environ" in content:
+            hits.extend(("services", var) for var in SERVICE_ENV_VARS if var in content)
+        
+        # Factor VI: session storage and filesystem writes
+        if suffix == ".js":
+            hits.extend(("session", desc) for pattern, desc in SESSION_VIOLATIONS if pattern.search(content))
+        if file.path in self._fs_sample and any(a in content for a in FS_ANCHORS):
+            hits.extend(("fs", desc) for pattern, desc in FS_PATTERNS if pattern.search(content))
+        
+        # Factor VII: port binding, until the top-priority pattern is seen anywhere
+        if suffix in [".js", ".py", ".rb"] and not self._port_top_hit.is_set() and \
+                any(a in content for a in SERVER_ANCHORS):
+            hit = _first_pattern(SERVER_UNION, SERVER_PATTERNS, content)
+            if hit is not None:
+                if hit == 0:
+                    self._port_top_hit.set()
+                hits.append(("port", SERVER_PATTERNS[hit][1]))
+        
+        # Factor IX: graceful shutdown
+        if any(a in content for a in SHUTDOWN_ANCHORS):
+            hits.extend(("shutdown", desc) for pattern, desc in SHUTDOWN_PATTERNS if pattern.search(content))
+        
+        # Factor XI: file-based and stdout logging
+        if suffix in [".py", ".js", ".java"]:
+            hits.extend(("log_file", desc) for needle, desc in LOG_FILE_NEEDLES if needle in content)
+            if any(a in content for a in LOG_FILE_ANCHORS):
+                hits.extend(("log_file", desc) for pattern, desc in LOG_FILE_PATTERNS if pattern.search(content))
+        if file.path in self._stdout_sample and any(needle in content for needle, _ in STDOUT_NEEDLES):
+            hits.append(("stdout", "stdout logging"))
+        
+        return hits
+    
+    def _exists(self, name: str) -> bool:
+        """Check a project-relative path, answering from the root listing where possible"""
+        top, nested, _ = name.partition("/")
+        if top not in self._root_entries:
+            return False
+        return not nested or os.path.exists(os.path.join(self.project_path, name))
     
     def check_factor_1_codebase(self):
         """Factor I: One codebase tracked in revision control"""
         print("📁 Factor I: Codebase")
         
         # Check for Git repository
-        git_dir = self.project_path / ".git"
-        if git_dir.exists():
-            self.passes.append("✓ Git repository found")
+        if ".git" in self._root_entries:
+            yield ("pass", "✓ Git repository found")
         else:
-            self.violations.append("✗ No Git repository found")
+            yield ("violation", "✗ No Git repository found")
         
         # Check for multiple apps in one repo (heuristic)
         app_indicators = ["package.json", "requirements.txt", "Gemfile", "pom.xml", "build.gradle"]
-        app_roots = []
-        for indicator in app_indicators:
-            app_roots.extend(self.project_path.rglob(indicator))
+        app_roots = {os.path.dirname(f.path) for f in self._files if f.name in app_indicators}
         
-        if len(set(p.parent for p in app_roots)) > 1:
-            self.warnings.append("⚠️  Multiple app roots detected - possible violation")
+        if len(app_roots) > 1:
+            yield ("warning", "⚠️  Multiple app roots detected - possible violation")
         
         # Check for .gitignore
-        if (self.project_path / ".gitignore").exists():
-            self.passes.append("✓ .gitignore present")
+        if ".gitignore" in self._root_entries:
+            yield ("pass", "✓ .gitignore present")
         else:
-            self.warnings.append("⚠️  No .gitignore file")
+            yield ("warning", "⚠️  No .gitignore file")
         
         print()
     
@@ -90,21 +345,21 @@ class TwelveFactorValidator:
         
         manifest_found = False
         for manifest, checker in manifests.items():
-            if (self.project_path / manifest).exists():
+            if manifest in self._root_entries:
                 manifest_found = True
-                checker()
+                yield from checker()
         
         if not manifest_found:
-            self.violations.append("✗ No dependency manifest found")
+            yield ("violation", "✗ No dependency manifest found")
         
         # Check for lock files
         lock_files = ["package-lock.json", "yarn.lock", "Pipfile.lock", "Gemfile.lock", "go.sum"]
-        lock_found = any((self.project_path / lock).exists() for lock in lock_files)
+        lock_found = any(lock in self._root_entries for lock in lock_files)
         
         if lock_found:
-            self.passes.append("✓ Dependency lock file present")
+            yield ("pass", "✓ Dependency lock file present")
         else:
-            self.warnings.append("⚠️  No lock file found - exact versions not guaranteed")
+            yield ("warning", "⚠️  No lock file found - exact versions not guaranteed")
         
         print()
     
@@ -114,40 +369,21 @@ class TwelveFactorValidator:
         
         # Check for .env.example or similar
         env_examples = [".env.example", ".env.sample", "env.example"]
-        if any((self.project_path / ex).exists() for ex in env_examples):
-            self.passes.append("✓ Environment variable documentation found")
+        if any(ex in self._root_entries for ex in env_examples):
+            yield ("pass", "✓ Environment variable documentation found")
         else:
-            self.warnings.append("⚠️  No .env.example file documenting required variables")
+            yield ("warning", "⚠️  No .env.example file documenting required variables")
         
         # Scan for hardcoded secrets/configs
-        suspicious_patterns = [
-            (r'(password|secret|key|token)\s*=\s*["\'][\w\d]{8,}["\']', "Hardcoded secrets"),
-            (r'(localhost|127\.0\.0\.1):\d+', "Hardcoded localhost URLs"),
-            (r'https?://[a-zA-Z0-9\.\-]+\.(com|org|net)', "Hardcoded external URLs"),
-            (r'[A-Z_]+\s*=\s*["\'][^"\']+["\']', "Possible hardcoded config")
-        ]
-        
-        code_files = list(self.project_path.rglob("*.py")) + \
-                    list(self.project_path.rglob("*.js")) + \
-                    list(self.project_path.rglob("*.java")) + \
-                    list(self.project_path.rglob("*.rb"))
-        
-        for file in code_files[:20]:  # Sample first 20 files
-            try:
-                content = file.read_text()
-                for pattern, desc in suspicious_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        self.warnings.append(f"⚠️  {desc} found in {file.relative_to(self.project_path)}")
-                        break
-            except:
-                pass
+        for file, desc in self._findings["config"]:
+            yield ("warning", f"⚠️  {desc} found in {file.path[len(self._root_str):]}")
         
         # Check for environment-specific config files
         bad_configs = ["config/production.json", "config/development.json", 
                       "settings/prod.py", "settings/dev.py"]
         for config in bad_configs:
-            if (self.project_path / config).exists():
-                self.violations.append(f"✗ Environment-specific config file: {config}")
+            if self._exists(config):
+                yield ("violation", f"✗ Environment-specific config file: {config}")
         
         print()
     
@@ -156,26 +392,10 @@ class TwelveFactorValidator:
         print("🔌 Factor IV: Backing Services")
         
         # Check if services are referenced via environment variables
-        env_patterns = [
-            "DATABASE_URL", "REDIS_URL", "RABBITMQ_URL", 
-            "ELASTICSEARCH_URL", "MONGODB_URI", "CACHE_URL"
-        ]
-        
-        found_service_configs = False
-        for file in self.project_path.rglob("*.py"):
-            try:
-                content = file.read_text()
-                for pattern in env_patterns:
-                    if f"os.environ" in content and pattern in content:
-                        found_service_configs = True
-                        break
-            except:
-                pass
-        
-        if found_service_configs:
-            self.passes.append("✓ Services referenced via environment variables")
+        if self._findings["services"]:
+            yield ("pass", "✓ Services referenced via environment variables")
         else:
-            self.warnings.append("⚠️  No backing service environment variables detected")
+            yield ("warning", "⚠️  No backing service environment variables detected")
         
         print()
     
@@ -184,20 +404,20 @@ class TwelveFactorValidator:
         print("🏗️  Factor V: Build, Release, Run")
         
         # Check for Dockerfile
-        if (self.project_path / "Dockerfile").exists():
-            self.passes.append("✓ Dockerfile present for containerized builds")
+        if "Dockerfile" in self._root_entries:
+            yield ("pass", "✓ Dockerfile present for containerized builds")
             
             # Analyze Dockerfile for good practices
             dockerfile_content = (self.project_path / "Dockerfile").read_text()
             if "COPY" in dockerfile_content and "RUN" in dockerfile_content:
-                self.passes.append("✓ Build steps separated in Dockerfile")
+                yield ("pass", "✓ Build steps separated in Dockerfile")
         else:
-            self.warnings.append("⚠️  No Dockerfile found")
+            yield ("warning", "⚠️  No Dockerfile found")
         
         # Check for CI/CD configuration
         ci_files = [".github/workflows", ".gitlab-ci.yml", "Jenkinsfile", ".circleci/config.yml"]
-        if any((self.project_path / ci).exists() for ci in ci_files):
-            self.passes.append("✓ CI/CD configuration found")
+        if any(self._exists(ci) for ci in ci_files):
+            yield ("pass", "✓ CI/CD configuration found")
         
         print()
     
@@ -206,34 +426,12 @@ class TwelveFactorValidator:
         print("🔄 Factor VI: Processes")
         
         # Check for session storage anti-patterns
-        session_violations = [
-            (r'session\[.+\]\s*=', "Session storage detected"),
-            (r'express-session.*store:\s*new\s*\w+Store', "Server-side session store"),
-            (r'sticky.?session', "Sticky sessions detected")
-        ]
-        
-        for file in self.project_path.rglob("*.js"):
-            try:
-                content = file.read_text()
-                for pattern, desc in session_violations:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        self.violations.append(f"✗ {desc} in {file.relative_to(self.project_path)}")
-            except:
-                pass
+        for file, desc in self._findings["session"]:
+            yield ("violation", f"✗ {desc} in {file.path[len(self._root_str):]}")
         
         # Check for file system usage beyond temp
-        fs_patterns = [
-            (r'fs\.write.*(?!\/tmp|\/temp)', "Writing to non-temp filesystem"),
-            (r'File\.open.*["\']w["\']', "File write operations detected")
-        ]
-        
-        for pattern, desc in fs_patterns:
-            for file in list(self.project_path.rglob("*.js"))[:10]:
-                try:
-                    if re.search(pattern, file.read_text()):
-                        self.warnings.append(f"⚠️  {desc} in {file.name}")
-                except:
-                    pass
+        for file, desc in self._findings["fs"]:
+            yield ("warning", f"⚠️  {desc} in {file.name}")
         
         print()
     
@@ -241,32 +439,17 @@ class TwelveFactorValidator:
         """Factor VII: Export services via port binding"""
         print("🚪 Factor VII: Port Binding")
         
-        # Check for self-contained web server
-        server_patterns = [
-            (r'app\.listen\(.*process\.env\.PORT', "Express.js with PORT env var"),
-            (r'http\.createServer.*\.listen\(.*process\.env\.PORT', "Node.js HTTP server"),
-            (r'port\s*=\s*os\.environ\.get\(["\']PORT', "Python PORT configuration"),
-            (r'Rails\.application\.config\.port', "Rails port configuration")
-        ]
-        
-        port_binding_found = False
-        for pattern, desc in server_patterns:
-            for file in self.project_path.rglob("*"):
-                if file.is_file() and file.suffix in [".js", ".py", ".rb"]:
-                    try:
-                        if re.search(pattern, file.read_text()):
-                            self.passes.append(f"✓ {desc} found")
-                            port_binding_found = True
-                            break
-                    except:
-                        pass
-        
-        if not port_binding_found:
-            self.warnings.append("⚠️  No PORT environment variable usage detected")
+        # Check for self-contained web server; the table is in priority order
+        found = {desc for _, desc in self._findings["port"]}
+        desc = next((d for _, d in SERVER_PATTERNS if d in found), None)
+        if desc:
+            yield ("pass", f"✓ {desc} found")
+        else:
+            yield ("warning", "⚠️  No PORT environment variable usage detected")
         
         # Check for WAR files or server modules
-        if list(self.project_path.rglob("*.war")):
-            self.violations.append("✗ WAR files suggest server container dependency")
+        if self._file_index[".war"]:
+            yield ("violation", "✗ WAR files suggest server container dependency")
         
         print()
     
@@ -275,22 +458,27 @@ class TwelveFactorValidator:
         print("⚡ Factor VIII: Concurrency")
         
         # Check for process formation files
-        if (self.project_path / "Procfile").exists():
-            self.passes.append("✓ Procfile defines process types")
+        if "Procfile" in self._root_entries:
+            yield ("pass", "✓ Procfile defines process types")
             procfile = (self.project_path / "Procfile").read_text()
             if "web:" in procfile and "worker:" in procfile:
-                self.passes.append("✓ Multiple process types defined")
+                yield ("pass", "✓ Multiple process types defined")
         else:
-            self.warnings.append("⚠️  No Procfile found")
+            yield ("warning", "⚠️  No Procfile found")
         
         # Check docker-compose for multi-process setup
-        compose_file = self.project_path / "docker-compose.yml"
-        if compose_file.exists():
+        if "docker-compose.yml" in self._root_entries:
+            import yaml  # deferred: only needed when a compose file exists
+            
+            # Prefer libyaml's C loader when PyYAML was built with it
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            compose_file = self.project_path / "docker-compose.yml"
             try:
-                compose_data = yaml.safe_load(compose_file.read_text())
-                if "services" in compose_data and len(compose_data["services"]) > 1:
-                    self.passes.append("✓ Multiple services in docker-compose")
-            except:
+                compose_data = yaml.load(compose_file.read_text(), Loader=loader)
+                services = compose_data.get("services") if isinstance(compose_data, dict) else None
+                if isinstance(services, (dict, list)) and len(services) > 1:
+                    yield ("pass", "✓ Multiple services in docker-compose")
+            except (OSError, UnicodeDecodeError, yaml.YAMLError):
                 pass
         
         print()
@@ -300,26 +488,13 @@ class TwelveFactorValidator:
         print("♻️  Factor IX: Disposability")
         
         # Check for graceful shutdown handlers
-        shutdown_patterns = [
-            (r'process\.on\(["\']SIGTERM', "SIGTERM handler (Node.js)"),
-            (r'signal\.signal\(signal\.SIGTERM', "SIGTERM handler (Python)"),
-            (r'trap.*TERM', "SIGTERM trap (Shell)")
-        ]
-        
-        graceful_shutdown = False
-        for pattern, desc in shutdown_patterns:
-            for file in self.project_path.rglob("*"):
-                if file.is_file():
-                    try:
-                        if re.search(pattern, file.read_text()):
-                            self.passes.append(f"✓ {desc} found")
-                            graceful_shutdown = True
-                            break
-                    except:
-                        pass
-        
-        if not graceful_shutdown:
-            self.warnings.append("⚠️  No graceful shutdown handlers detected")
+        found = {desc for _, desc in self._findings["shutdown"]}
+        for _, desc in SHUTDOWN_PATTERNS:
+            if desc in found:
+                yield ("pass", f"✓ {desc} found")
+        
+        if not found:
+            yield ("warning", "⚠️  No graceful shutdown handlers detected")
         
         print()
     
@@ -328,14 +503,14 @@ class TwelveFactorValidator:
         print("🔄 Factor X: Dev/Prod Parity")
         
         # Check Docker usage for consistency
-        if (self.project_path / "Dockerfile").exists():
-            if (self.project_path / "docker-compose.yml").exists():
-                self.passes.append("✓ Docker used for environment consistency")
+        if "Dockerfile" in self._root_entries:
+            if "docker-compose.yml" in self._root_entries:
+                yield ("pass", "✓ Docker used for environment consistency")
         
         # Check for environment-specific dependencies
-        if (self.project_path / "requirements-dev.txt").exists() or \
-           (self.project_path / "package-dev.json").exists():
-            self.warnings.append("⚠️  Separate dev dependencies might indicate divergence")
+        if "requirements-dev.txt" in self._root_entries or \
+           "package-dev.json" in self._root_entries:
+            yield ("warning", "⚠️  Separate dev dependencies might indicate divergence")
         
         print()
     
@@ -344,41 +519,12 @@ class TwelveFactorValidator:
         print("📋 Factor XI: Logs")
         
         # Check for file-based logging anti-patterns
-        log_file_patterns = [
-            (r'FileHandler|RotatingFileHandler', "File-based logging (Python)"),
-            (r'winston.*filename:', "File-based logging (Node.js)"),
-            (r'log4j.*FileAppender', "File-based logging (Java)")
-        ]
-        
-        for pattern, desc in log_file_patterns:
-            for file in self.project_path.rglob("*"):
-                if file.is_file() and file.suffix in [".py", ".js", ".java"]:
-                    try:
-                        if re.search(pattern, file.read_text()):
-                            self.violations.append(f"✗ {desc} in {file.name}")
-                    except:
-                        pass
+        for file, desc in self._findings["log_file"]:
+            yield ("violation", f"✗ {desc} in {file.name}")
         
         # Check for console/stdout logging
-        stdout_patterns = [
-            (r'console\.log|console\.error', "Console logging (Node.js)"),
-            (r'print\(|logging\.StreamHandler', "stdout logging (Python)"),
-            (r'System\.out\.println', "stdout logging (Java)")
-        ]
-        
-        stdout_found = False
-        for pattern, desc in stdout_patterns:
-            for file in list(self.project_path.rglob("*"))[:20]:
-                if file.is_file():
-                    try:
-                        if re.search(pattern, file.read_text()):
-                            stdout_found = True
-                            break
-                    except:
-                        pass
-        
-        if stdout_found:
-            self.passes.append("✓ stdout/console logging detected")
+        if self._findings["stdout"]:
+            yield ("pass", "✓ stdout/console logging detected")
         
         print()
     
@@ -388,15 +534,15 @@ class TwelveFactorValidator:
         
         # Check for admin scripts
         admin_dirs = ["scripts", "bin", "tasks", "management"]
-        admin_found = any((self.project_path / d).exists() for d in admin_dirs)
+        admin_found = any(d in self._root_entries for d in admin_dirs)
         
         if admin_found:
-            self.passes.append("✓ Admin scripts directory found")
+            yield ("pass", "✓ Admin scripts directory found")
         
         # Check for migration tools
         migration_patterns = ["migrations", "db/migrate", "alembic"]
-        if any((self.project_path / m).exists() for m in migration_patterns):
-            self.passes.append("✓ Database migration structure found")
+        if any(self._exists(m) for m in migration_patterns):
+            yield ("pass", "✓ Database migration structure found")
         
         print()
     
@@ -405,79 +551,77 @@ class TwelveFactorValidator:
         pkg_file = self.project_path / "package.json"
         try:
             pkg_data = json.loads(pkg_file.read_text())
-            deps = pkg_data.get("dependencies", {})
+            if not isinstance(pkg_data, dict):
+                return
+            deps = pkg_data.get("dependencies") or {}
+            if not isinstance(deps, dict):
+                return
             
             # Check for exact versions
-            fuzzy_versions = [d for d in deps.values() if any(c in d for c in ["^", "~", "*"])]
+            fuzzy_versions = sum(1 for d in deps.values() if isinstance(d, str) and FUZZY_VERSION.search(d))
             if fuzzy_versions:
-                self.warnings.append(f"⚠️  {len(fuzzy_versions)} dependencies with fuzzy versions")
+                yield ("warning", f"⚠️  {fuzzy_versions} dependencies with fuzzy versions")
             else:
-                self.passes.append("✓ All npm dependencies have exact versions")
-        except:
+                yield ("pass", "✓ All npm dependencies have exact versions")
+        except (OSError, ValueError):
             pass
     
     def _check_python_deps(self):
         req_file = self.project_path / "requirements.txt"
         try:
             content = req_file.read_text()
-            lines = [l.strip() for l in content.split('\n') if l.strip() and not l.startswith('#')]
             
             # Check for version pinning
-            unpinned = [l for l in lines if "==" not in l and not l.startswith('-')]
+            unpinned = sum(1 for _ in UNPINNED_REQUIREMENT.finditer(content))
             if unpinned:
-                self.warnings.append(f"⚠️  {len(unpinned)} Python dependencies without exact versions")
+                yield ("warning", f"⚠️  {unpinned} Python dependencies without exact versions")
             else:
-                self.passes.append("✓ All Python dependencies have exact versions")
-        except:
+                yield ("pass", "✓ All Python dependencies have exact versions")
+        except (OSError, UnicodeDecodeError):
             pass
     
     def _check_pipenv_deps(self):
-        self.passes.append("✓ Pipenv used for dependency management")
+        yield ("pass", "✓ Pipenv used for dependency management")
     
     def _check_ruby_deps(self):
-        self.passes.append("✓ Gemfile present for dependency management")
+        yield ("pass", "✓ Gemfile present for dependency management")
     
     def _check_maven_deps(self):
-        self.passes.append("✓ Maven pom.xml present for dependency management")
+        yield ("pass", "✓ Maven pom.xml present for dependency management")
     
     def _check_gradle_deps(self):
-        self.passes.append("✓ Gradle build file present for dependency management")
+        yield ("pass", "✓ Gradle build file present for dependency management")
     
     def _check_go_deps(self):
-        self.passes.append("✓ Go modules used for dependency management")
+        yield ("pass", "✓ Go modules used for dependency management")
 
 
-def generate_report(results: Dict):
-    """Generate a formatted validation report"""
+def generate_report(findings: Iterable[Tuple[str, str]]):
+    """Generate a formatted validation report from a stream of findings"""
+    sections = {"pass": io.StringIO(), "warning": io.StringIO(), "violation": io.StringIO()}
+    counts = dict.fromkeys(sections, 0)
+    for severity, message in findings:
+        sections[severity].write(f"  {message}\n")
+        counts[severity] += 1
+    
+    score = counts["pass"] / max(counts["pass"] + counts["violation"], 1) * 100
+    
     print("\n" + "="*60)
     print("📊 12-FACTOR VALIDATION REPORT")
     print("="*60 + "\n")
     
-    print(f"Score: {results['score']:.1f}%\n")
-    
-    if results['passes']:
-        print("✅ PASSES:")
-        for p in results['passes']:
-            print(f"  {p}")
-        print()
+    print(f"Score: {score:.1f}%\n")
     
-    if results['warnings']:
-        print("⚠️  WARNINGS:")
-        for w in results['warnings']:
-            print(f"  {w}")
-        print()
-    
-    if results['violations']:
-        print("❌ VIOLATIONS:")
-        for v in results['violations']:
-            print(f"  {v}")
-        print()
+    for severity, title in [("pass", "✅ PASSES:"), ("warning", "⚠️  WARNINGS:"), ("violation", "❌ VIOLATIONS:")]:
+        if counts[severity]:
+            print(title)
+            print(sections[severity].getvalue())
     
     # Recommendations
     print("📝 RECOMMENDATIONS:")
-    if results['score'] < 50:
+    if score < 50:
         print("  - Critical: Address violations before deployment")
-    elif results['score'] < 80:
+    elif score < 80:
         print("  - Moderate: Fix violations and review warnings")
     else:
         print("  - Good: Review warnings for optimization opportunities")
@@ -497,5 +641,4 @@ if __name__ == "__main__":
         sys.exit(1)
     
     validator = TwelveFactorValidator(project_path)
-    results = validator.validate_all()
-    generate_report(results)
+    generate_report(validator.validate_all())